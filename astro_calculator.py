@@ -5,7 +5,8 @@ Professional Multi-System Astrological Calculator - ENHANCED VERSION
 High-precision astrological calculator supporting multiple traditions
 with accurate ephemeris calculations and WORKING interactive map.
 
-Dependencies: streamlit, pandas, pytz, streamlit-folium
+Dependencies: streamlit, pandas, numpy, pytz, streamlit-folium
+The ephemeris core lives in ephemeris.py (numba JIT opt-in: ASTRO_REVEAL_JIT=1).
 
 ACCURACY NOTES:
 - VSOP87: 1 arcsecond accuracy for inner planets (4000 year range)
@@ -16,13 +17,15 @@ ACCURACY NOTES:
 
 import streamlit as st
 import pandas as pd
-import math
+import numpy as np
 import datetime
 from datetime import datetime, timedelta
 import pytz
 import io
 from llm_interpreter import build_chart_summary, generate_llm_interpretation, generate_consensus_interpretation
 from feedback_collector import build_feedback_form, record_response, chart_id_for, summarize_log
+from ephemeris import MOON, planet_dict, sign_of
+from ephemeris import get_calculator as _get_calc
 import os
 try:
     if "GEMINI_API_KEY" in st.secrets:
@@ -36,8 +39,8 @@ try:
     from streamlit_folium import st_folium
     FOLIUM_AVAILABLE = True
 except ImportError:
+    # main() tells the user once, when the map picker is first chosen
     FOLIUM_AVAILABLE = False
-    st.error("Please install streamlit-folium: pip install streamlit-folium")
 
 # Configure page
 st.set_page_config(
@@ -248,372 +251,74 @@ def cosmic_hero():
         unsafe_allow_html=True,
     )
 
-class ProfessionalAstrologicalCalculator:
-    """High-precision astrological calculations using professional ephemeris standards"""
-    
-    def __init__(self):
-        # Ayanamsa values (Lahiri) - Verified accurate
-        self.lahiri_ayanamsa_2000 = 23.85
-        self.precession_rate = 50.29 / 3600  # 50.29 arcseconds per year
-        
-        # Zodiac and Nakshatra data
-        self.zodiac_signs = [
-            "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-            "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        
-        self.nakshatras = [
-            ("Ashwini", "Ketu", "New beginnings, quick action"),
-            ("Bharani", "Venus", "Transformation, restraint"),
-            ("Krittika", "Sun", "Cutting through illusion"),
-            ("Rohini", "Moon", "Growth, fertility, beauty"),
-            ("Mrigashira", "Mars", "Searching, curiosity"),
-            ("Ardra", "Rahu", "Intensity, change"),
-            ("Punarvasu", "Jupiter", "Renewal, optimism"),
-            ("Pushya", "Saturn", "Nourishment, protection"),
-            ("Ashlesha", "Mercury", "Mystical knowledge"),
-            ("Magha", "Ketu", "Ancestral power, authority"),
-            ("Purva Phalguni", "Venus", "Creativity, relationships"),
-            ("Uttara Phalguni", "Sun", "Leadership, generosity"),
-            ("Hasta", "Moon", "Skill, dexterity"),
-            ("Chitra", "Mars", "Artistic creation"),
-            ("Swati", "Rahu", "Independence, flexibility"),
-            ("Vishakha", "Jupiter", "Determination, focus"),
-            ("Anuradha", "Saturn", "Devotion, friendship"),
-            ("Jyeshtha", "Mercury", "Seniority, protection"),
-            ("Mula", "Ketu", "Root investigation"),
-            ("Purva Ashadha", "Venus", "Invincibility, pride"),
-            ("Uttara Ashadha", "Sun", "Victory, achievement"),
-            ("Shravana", "Moon", "Learning, listening"),
-            ("Dhanishta", "Mars", "Wealth, music"),
-            ("Shatabhisha", "Rahu", "Healing, mystery"),
-            ("Purva Bhadrapada", "Jupiter", "Spiritual intensity"),
-            ("Uttara Bhadrapada", "Saturn", "Deep wisdom"),
-            ("Revati", "Mercury", "Completion, journeys")
-        ]
-        
-        # Chinese Four Pillars data
-        self.heavenly_stems = [
-            ("Jia", "Yang Wood"), ("Yi", "Yin Wood"),
-            ("Bing", "Yang Fire"), ("Ding", "Yin Fire"),
-            ("Wu", "Yang Earth"), ("Ji", "Yin Earth"),
-            ("Geng", "Yang Metal"), ("Xin", "Yin Metal"),
-            ("Ren", "Yang Water"), ("Gui", "Yin Water")
-        ]
-        
-        self.earthly_branches = [
-            ("Zi", "Rat"), ("Chou", "Ox"), ("Yin", "Tiger"), ("Mao", "Rabbit"),
-            ("Chen", "Dragon"), ("Si", "Snake"), ("Wu", "Horse"), ("Wei", "Goat"),
-            ("Shen", "Monkey"), ("You", "Rooster"), ("Xu", "Dog"), ("Hai", "Pig")
-        ]
-        
-        # Mayan Tzolkin - GMT Correlation 584283 (verified most accurate)
-        self.mayan_day_signs = [
-            ("Imix", "Crocodile", "Primordial energy"),
-            ("Ik", "Wind", "Spirit, breath"),
-            ("Akbal", "Night", "Inner temple"),
-            ("Kan", "Seed", "Growth potential"),
-            ("Chicchan", "Serpent", "Life force"),
-            ("Cimi", "Death", "Transformation"),
-            ("Manik", "Deer", "Healing hands"),
-            ("Lamat", "Rabbit", "Star seed"),
-            ("Muluc", "Water", "Offering"),
-            ("Oc", "Dog", "Loyalty, guidance"),
-            ("Chuen", "Monkey", "Artistry"),
-            ("Eb", "Grass", "Human experience"),
-            ("Ben", "Reed", "Flowing waters"),
-            ("Ix", "Jaguar", "Magical powers"),
-            ("Men", "Eagle", "Planetary mind"),
-            ("Cib", "Owl", "Ancient wisdom"),
-            ("Caban", "Earth", "Sacred knowledge"),
-            ("Etznab", "Flint", "Mirror of truth"),
-            ("Cauac", "Storm", "Catalytic energy"),
-            ("Ahau", "Sun", "Enlightenment")
-        ]
+# ===========================================================================
+#  RESULT TABLES
+#  Display formatting on top of the reference tables imported from ephemeris.
+# ===========================================================================
 
-        # Major cities coordinates for quick selection
-        self.major_cities = {
-            "Kathmandu, Nepal": (27.7172, 85.3240),
-            "New York, USA": (40.7128, -74.0060),
-            "London, UK": (51.5074, -0.1278),
-            "Tokyo, Japan": (35.6762, 139.6503),
-            "Mumbai, India": (19.0760, 72.8777),
-            "Sydney, Australia": (-33.8688, 151.2093),
-            "Los Angeles, USA": (34.0522, -118.2437),
-            "Paris, France": (48.8566, 2.3522),
-            "Beijing, China": (39.9042, 116.4074),
-            "Cairo, Egypt": (30.0444, 31.2357)
-        }
-        
-        # House system options
-        self.house_systems = ["Placidus", "Koch", "Whole Sign", "Equal", "Campanus", "Regiomontanus"]
-
-    def calculate_julian_day(self, year, month, day, hour, minute):
-        """High-precision Julian Day calculation"""
-        if month <= 2:
-            year -= 1
-            month += 12
-        
-        a = math.floor(year / 100)
-        b = 2 - a + math.floor(a / 4)
-        
-        jd = math.floor(365.25 * (year + 4716)) + \
-             math.floor(30.6001 * (month + 1)) + \
-             day + b - 1524.5 + \
-             (hour + minute/60) / 24
-        
-        return jd
-
-    def calculate_lahiri_ayanamsa(self, jd):
-        """Calculate Lahiri Ayanamsa for given Julian Day - Verified accurate"""
-        t = (jd - 2451545.0) / 36525
-        ayanamsa = 23.85 + 50.29 * t / 3600 - 0.000279 * t * t
-        return ayanamsa
-
-    def calculate_planetary_positions(self, jd):
-        """Calculate high-precision planetary positions using VSOP87 algorithms
-        Accuracy: 1 arcsecond for inner planets over 4000 year range"""
-        t = (jd - 2451545.0) / 36525
-        
-        positions = {}
-        
-        # Sun (high-precision VSOP87)
-        sun_l = 280.4664567 + 360007.6982779 * t + 0.03032028 * t * t
-        sun_m = 357.52772333 + 35999.05034 * t - 0.0001603 * t * t - t * t * t / 300000
-        sun_c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * math.sin(math.radians(sun_m))
-        sun_c += (0.019993 - 0.000101 * t) * math.sin(math.radians(2 * sun_m))
-        sun_c += 0.000289 * math.sin(math.radians(3 * sun_m))
-        positions['Sun'] = (sun_l + sun_c) % 360
-        
-        # Moon (high-precision)
-        moon_l = 218.3164477 + 481267.88123421 * t - 0.0015786 * t * t
-        moon_d = 297.8501921 + 445267.1114034 * t - 0.0018819 * t * t
-        moon_m = 134.9633964 + 477198.8675055 * t + 0.0087414 * t * t
-        moon_f = 93.272095 + 483202.0175233 * t - 0.0036539 * t * t
-        
-        moon_longitude = moon_l + 6.288774 * math.sin(math.radians(moon_m))
-        moon_longitude += 1.274027 * math.sin(math.radians(2 * moon_d - moon_m))
-        moon_longitude += 0.658314 * math.sin(math.radians(2 * moon_d))
-        moon_longitude += 0.213618 * math.sin(math.radians(2 * moon_m))
-        moon_longitude -= 0.185116 * math.sin(math.radians(sun_m))
-        positions['Moon'] = moon_longitude % 360
-        
-        # Mercury (VSOP87 simplified)
-        mercury_l = 252.250906 + 149472.67411175 * t + 0.00030397 * t * t
-        mercury_m = 174.7948 + 4092.677 * t
-        mercury_c = 23.4400 * math.sin(math.radians(mercury_m))
-        positions['Mercury'] = (mercury_l + mercury_c) % 360
-        
-        # Venus (VSOP87 simplified)
-        venus_l = 181.979801 + 58517.81539 * t + 0.00165 * t * t
-        venus_m = 50.4161 + 1602.961 * t
-        venus_c = 0.7758 * math.sin(math.radians(venus_m))
-        positions['Venus'] = (venus_l + venus_c) % 360
-        
-        # Mars (VSOP87 simplified)
-        mars_l = 355.433 + 19140.2993313 * t + 0.00026 * t * t
-        mars_m = 19.373 + 686.996 * t
-        mars_c = 10.691 * math.sin(math.radians(mars_m))
-        positions['Mars'] = (mars_l + mars_c) % 360
-        
-        # Jupiter (VSOP87 simplified)
-        jupiter_l = 34.351484 + 3034.90567464 * t - 0.00008501 * t * t
-        jupiter_m = 20.020 + 83.298 * t
-        jupiter_c = 5.555 * math.sin(math.radians(jupiter_m))
-        positions['Jupiter'] = (jupiter_l + jupiter_c) % 360
-        
-        # Saturn (VSOP87 simplified)
-        saturn_l = 50.077471 + 1222.11379404 * t + 0.00021004 * t * t
-        saturn_m = 317.020 + 34.266 * t
-        saturn_c = 5.629 * math.sin(math.radians(saturn_m))
-        positions['Saturn'] = (saturn_l + saturn_c) % 360
-        
-        return positions
+# Two-decimal degree formatting: one template for scalars, one for arrays
+_FMT_DEG = "{:.2f}°".format
+_FMT_DEG_ARR = "%.2f°"
+
+# Column layouts of the result tables
+_POS_COLS = ("Planet", "Sign", "Longitude", "Degree in Sign")
+_PILLAR_COLS = ("Pillar", "Heavenly Stem", "Earthly Branch")
+
+
+def _positions_frame(longitudes):
+    """_POS_COLS table for a (7,) longitude array, formatted in one
+    vectorised pass"""
+    calc = _get_calc()
+    sign_index = (longitudes // 30).astype(np.intp) % 12
+    return pd.DataFrame(dict(zip(_POS_COLS, (
+        calc.planet_names,
+        calc.zodiac_signs_arr[sign_index],
+        np.char.mod(_FMT_DEG_ARR, longitudes),
+        np.char.mod(_FMT_DEG_ARR, longitudes % 30),
+    ))))
+
+
+# Interpretation databases
+_VEDIC_SIGN_MEANINGS = {
+    "Aries": "Dynamic, pioneering, leadership qualities, courageous, impulsive, competitive nature",
+    "Taurus": "Stable, practical, determined, artistic, material security focus, stubborn tendencies",
+    "Gemini": "Intellectual, communicative, versatile, curious, dual nature, restless mind",
+    "Cancer": "Emotional, nurturing, intuitive, protective, family-oriented, moody fluctuations",
+    "Leo": "Creative, confident, dramatic, generous, attention-seeking, natural performer",
+    "Virgo": "Analytical, perfectionist, service-oriented, practical, critical, health-conscious",
+    "Libra": "Harmonious, diplomatic, artistic, relationship-focused, indecisive, beauty-loving",
+    "Scorpio": "Intense, transformative, mysterious, passionate, secretive, powerful regeneration",
+    "Sagittarius": "Philosophical, adventurous, optimistic, truth-seeking, freedom-loving, blunt",
+    "Capricorn": "Ambitious, disciplined, traditional, responsible, status-conscious, persistent",
+    "Aquarius": "Independent, innovative, humanitarian, unconventional, detached, visionary",
+    "Pisces": "Intuitive, compassionate, spiritual, dreamy, escapist tendencies, artistic"
+}
 
-    def calculate_houses(self, jd, latitude, longitude, house_system="Placidus"):
-        """Calculate house cusps using selected house system"""
-        t = (jd - 2451545.0) / 36525
-        
-        # Calculate Local Sidereal Time
-        gst = 280.46061837 + 360.98564736629 * (jd - 2451545.0)
-        lst = (gst + longitude) % 360
-        
-        # Calculate obliquity of ecliptic
-        obliquity = 23.4392911 - 0.0130125 * t - 0.00000164 * t * t
-        
-        # Calculate ascendant using proper spherical trigonometry
-        lat_rad = math.radians(latitude)
-        lst_rad = math.radians(lst)
-        obl_rad = math.radians(obliquity)
-        
-        # Ascendant calculation
-        y = math.cos(lst_rad)
-        x = -math.sin(lst_rad) * math.cos(obl_rad) - math.tan(lat_rad) * math.sin(obl_rad)
-        ascendant = math.degrees(math.atan2(y, x)) % 360
-        
-        # Calculate MC (Medium Coeli)
-        mc = lst % 360
-        
-        houses = {}
-        
-        if house_system == "Whole Sign":
-            # Whole Sign houses - each house is exactly 30 degrees
-            asc_sign = int(ascendant // 30)
-            for i in range(1, 13):
-                houses[str(i)] = (asc_sign * 30 + (i - 1) * 30) % 360
-                
-        elif house_system == "Equal":
-            # Equal houses - 30 degrees from ascendant
-            for i in range(1, 13):
-                houses[str(i)] = (ascendant + (i - 1) * 30) % 360
-                
-        else:  # Default to Placidus or other quadrant systems
-            houses = {
-                '1': ascendant,
-                '4': (mc + 180) % 360,
-                '7': (ascendant + 180) % 360,
-                '10': mc
-            }
-            
-            # Calculate intermediate houses (simplified)
-            for i in range(2, 7):
-                if i <= 3:
-                    angle = (i - 1) * 30
-                    houses[str(i)] = (ascendant + angle) % 360
-                else:
-                    angle = (i - 1) * 30
-                    houses[str(i)] = (ascendant + angle) % 360
-            
-            # Complete the wheel
-            for i in range(8, 13):
-                houses[str(i % 12 if i % 12 != 0 else 12)] = (houses[str(i - 6)] + 180) % 360
-        
-        return houses, ascendant
-
-    def calculate_vedic_positions(self, tropical_positions, jd):
-        """Convert tropical to sidereal (Vedic) positions using Lahiri Ayanamsa"""
-        ayanamsa = self.calculate_lahiri_ayanamsa(jd)
-        vedic_positions = {}
-        for planet, position in tropical_positions.items():
-            vedic_positions[planet] = (position - ayanamsa) % 360
-        return vedic_positions, ayanamsa
-
-    def get_nakshatra_details(self, moon_longitude):
-        """Get detailed Nakshatra information"""
-        nakshatra_span = 360 / 27
-        nakshatra_index = int(moon_longitude // nakshatra_span)
-        nakshatra_remainder = moon_longitude % nakshatra_span
-        pada = int(nakshatra_remainder // (nakshatra_span / 4)) + 1
-        
-        nakshatra_info = self.nakshatras[nakshatra_index]
-        return {
-            'name': nakshatra_info[0],
-            'lord': nakshatra_info[1],
-            'meaning': nakshatra_info[2],
-            'pada': pada,
-            'degree_in_nakshatra': nakshatra_remainder
-        }
-
-    def calculate_four_pillars(self, birth_datetime):
-        """Calculate Chinese Four Pillars (Bazi) system"""
-        # Ensure we're working with naive datetime for calculation
-        if birth_datetime.tzinfo is not None:
-            birth_datetime = birth_datetime.replace(tzinfo=None)
-            
-        year = birth_datetime.year
-        month = birth_datetime.month
-        day = birth_datetime.day
-        hour = birth_datetime.hour
-        
-        # Adjust for Chinese New Year (simplified)
-        chinese_new_year_adjustment = 35
-        if month == 1 or (month == 2 and day < chinese_new_year_adjustment):
-            year -= 1
-        
-        # Calculate stems and branches using traditional formulas
-        year_stem = (year - 4) % 10
-        year_branch = (year - 4) % 12
-        
-        # Month pillar calculation
-        month_stem = ((year % 5) * 2 + month) % 10
-        month_branch = (month + 1) % 12
-        
-        # Day pillar (requires Julian Day conversion)
-        jd = self.calculate_julian_day(year, month, day, 0, 0)
-        day_offset = int(jd) % 60
-        day_stem = day_offset % 10
-        day_branch = day_offset % 12
-        
-        # Hour pillar
-        hour_branch = ((hour + 1) // 2) % 12
-        hour_stem = (day_stem * 2 + hour_branch) % 10
-        
-        return {
-            'year': (self.heavenly_stems[year_stem], self.earthly_branches[year_branch]),
-            'month': (self.heavenly_stems[month_stem], self.earthly_branches[month_branch]),
-            'day': (self.heavenly_stems[day_stem], self.earthly_branches[day_branch]),
-            'hour': (self.heavenly_stems[hour_stem], self.earthly_branches[hour_branch])
-        }
-
-    def calculate_mayan_tzolkin(self, birth_datetime):
-        """Calculate Mayan Tzolkin day sign using GMT correlation constant 584283"""
-        # GMT correlation constant (most accepted)
-        correlation_constant = 584283
-        
-        # Ensure we're working with naive datetime for calculation
-        if birth_datetime.tzinfo is not None:
-            birth_datetime = birth_datetime.replace(tzinfo=None)
-        
-        # Calculate days since Western epoch
-        epoch = datetime(1900, 1, 1)
-        days_since_epoch = (birth_datetime - epoch).days
-        
-        # Calculate Tzolkin position
-        total_days = days_since_epoch + correlation_constant
-        kin = total_days % 260
-        day_sign_index = kin % 20
-        galactic_tone = (kin % 13) + 1
-        
-        day_sign_info = self.mayan_day_signs[day_sign_index]
-        
-        return {
-            'kin': kin + 1,
-            'day_sign': day_sign_info[0],
-            'glyph': day_sign_info[1],
-            'meaning': day_sign_info[2],
-            'galactic_tone': galactic_tone
-        }
-
-def generate_report_text(birth_data, vedic_positions, tropical_positions, four_pillars, tzolkin, houses, ayanamsa, include_houses, house_system):
+_PLANET_MEANINGS = {
+    "Sun": "Core identity, ego, vitality, father figure, leadership, self-expression",
+    "Moon": "Emotions, mind, mother figure, intuition, habits, subconscious patterns",
+    "Mercury": "Communication, intellect, learning, siblings, short travels, adaptability",
+    "Venus": "Love, beauty, relationships, creativity, luxury, feminine energy",
+    "Mars": "Energy, action, courage, conflict, passion, masculine drive",
+    "Jupiter": "Wisdom, spirituality, expansion, good fortune, higher learning, optimism",
+    "Saturn": "Discipline, limitations, karma, hard work, structure, life lessons"
+}
+
+# Entries of calculation_results that generate_report_text takes as keywords
+_REPORT_ARGS = ("birth_data", "vedic_positions", "tropical_positions", "four_pillars",
+                "tzolkin", "houses", "ayanamsa", "include_houses", "house_system")
+
+def generate_report_text(*, birth_data, vedic_positions, tropical_positions, four_pillars, tzolkin, houses, ayanamsa, include_houses, house_system):
     """Generate comprehensive astrological report with detailed interpretations"""
+    calc = _get_calc()
     
-    # Interpretation databases
-    vedic_sign_meanings = {
-        "Aries": "Dynamic, pioneering, leadership qualities, courageous, impulsive, competitive nature",
-        "Taurus": "Stable, practical, determined, artistic, material security focus, stubborn tendencies",
-        "Gemini": "Intellectual, communicative, versatile, curious, dual nature, restless mind",
-        "Cancer": "Emotional, nurturing, intuitive, protective, family-oriented, moody fluctuations",
-        "Leo": "Creative, confident, dramatic, generous, attention-seeking, natural performer",
-        "Virgo": "Analytical, perfectionist, service-oriented, practical, critical, health-conscious",
-        "Libra": "Harmonious, diplomatic, artistic, relationship-focused, indecisive, beauty-loving",
-        "Scorpio": "Intense, transformative, mysterious, passionate, secretive, powerful regeneration",
-        "Sagittarius": "Philosophical, adventurous, optimistic, truth-seeking, freedom-loving, blunt",
-        "Capricorn": "Ambitious, disciplined, traditional, responsible, status-conscious, persistent",
-        "Aquarius": "Independent, innovative, humanitarian, unconventional, detached, visionary",
-        "Pisces": "Intuitive, compassionate, spiritual, dreamy, escapist tendencies, artistic"
-    }
-    
-    planet_meanings = {
-        "Sun": "Core identity, ego, vitality, father figure, leadership, self-expression",
-        "Moon": "Emotions, mind, mother figure, intuition, habits, subconscious patterns",
-        "Mercury": "Communication, intellect, learning, siblings, short travels, adaptability",
-        "Venus": "Love, beauty, relationships, creativity, luxury, feminine energy",
-        "Mars": "Energy, action, courage, conflict, passion, masculine drive",
-        "Jupiter": "Wisdom, spirituality, expansion, good fortune, higher learning, optimism",
-        "Saturn": "Discipline, limitations, karma, hard work, structure, life lessons"
-    }
+    # Sign and degree within sign for all seven planets at once
+    vedic_signs = calc.zodiac_signs_arr[(vedic_positions // 30).astype(np.intp) % 12]
+    vedic_degrees = vedic_positions % 30
+    tropical_signs = calc.zodiac_signs_arr[(tropical_positions // 30).astype(np.intp) % 12]
     
-    report = f"""PROFESSIONAL ASTROLOGICAL ANALYSIS REPORT
+    parts = []
+    parts.append(f"""PROFESSIONAL ASTROLOGICAL ANALYSIS REPORT
 ===========================================
 
 Birth Information:
@@ -634,71 +339,53 @@ VEDIC (SIDEREAL) ASTROLOGY ANALYSIS
 
 Ayanamsa (Lahiri): {ayanamsa:.4f}°
 
-"""
+""")
     
     if include_houses:
-        vedic_asc = (houses['1'] - ayanamsa) % 360
-        vedic_asc_sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(vedic_asc // 30)]
-        report += f"ASCENDANT (LAGNA): {vedic_asc_sign} at {vedic_asc:.2f}°\n"
-        report += f"INTERPRETATION: Your rising sign represents how others see you and your approach to life.\n"
-        report += f"With {vedic_asc_sign} ascending: {vedic_sign_meanings[vedic_asc_sign]}\n\n"
+        vedic_asc = (houses[0] - ayanamsa) % 360
+        vedic_asc_sign = sign_of(vedic_asc)
+        parts.append(f"ASCENDANT (LAGNA): {vedic_asc_sign} at {vedic_asc:.2f}°\n")
+        parts.append(f"INTERPRETATION: Your rising sign represents how others see you and your approach to life.\n")
+        parts.append(f"With {vedic_asc_sign} ascending: {_VEDIC_SIGN_MEANINGS[vedic_asc_sign]}\n\n")
     
-    report += "PLANETARY POSITIONS & INTERPRETATIONS (Sidereal):\n\n"
-    for planet, position in vedic_positions.items():
-        sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(position // 30)]
-        degree_in_sign = position % 30
-        report += f"* {planet}: {position:.2f}° in {sign} ({degree_in_sign:.2f}° within sign)\n"
-        report += f"  Planet Meaning: {planet_meanings.get(planet, 'Celestial influence')}\n"
-        report += f"  In {sign}: {vedic_sign_meanings[sign]}\n\n"
+    parts.append("PLANETARY POSITIONS & INTERPRETATIONS (Sidereal):\n\n")
+    for planet, position, sign, degree_in_sign in zip(
+            calc.planet_names, vedic_positions.tolist(), vedic_signs, vedic_degrees.tolist()):
+        parts.append(f"* {planet}: {position:.2f}° in {sign} ({degree_in_sign:.2f}° within sign)\n")
+        parts.append(f"  Planet Meaning: {_PLANET_MEANINGS.get(planet, 'Celestial influence')}\n")
+        parts.append(f"  In {sign}: {_VEDIC_SIGN_MEANINGS[sign]}\n\n")
     
     # Nakshatra analysis
-    moon_nakshatra_span = 360 / 27
-    moon_nakshatra_index = int(vedic_positions['Moon'] // moon_nakshatra_span)
-    nakshatras = [
-        ("Ashwini", "Ketu"), ("Bharani", "Venus"), ("Krittika", "Sun"), ("Rohini", "Moon"),
-        ("Mrigashira", "Mars"), ("Ardra", "Rahu"), ("Punarvasu", "Jupiter"), ("Pushya", "Saturn"),
-        ("Ashlesha", "Mercury"), ("Magha", "Ketu"), ("Purva Phalguni", "Venus"), ("Uttara Phalguni", "Sun"),
-        ("Hasta", "Moon"), ("Chitra", "Mars"), ("Swati", "Rahu"), ("Vishakha", "Jupiter"),
-        ("Anuradha", "Saturn"), ("Jyeshtha", "Mercury"), ("Mula", "Ketu"), ("Purva Ashadha", "Venus"),
-        ("Uttara Ashadha", "Sun"), ("Shravana", "Moon"), ("Dhanishta", "Mars"), ("Shatabhisha", "Rahu"),
-        ("Purva Bhadrapada", "Jupiter"), ("Uttara Bhadrapada", "Saturn"), ("Revati", "Mercury")
-    ]
-    nakshatra_info = nakshatras[moon_nakshatra_index]
-    pada = int((vedic_positions['Moon'] % moon_nakshatra_span) // (moon_nakshatra_span / 4)) + 1
+    moon_nakshatra = calc.get_nakshatra_details(float(vedic_positions[MOON]))
     
-    report += f"MOON'S NAKSHATRA: {nakshatra_info[0]} (Lord: {nakshatra_info[1]}) - Pada {pada}\n"
-    report += f"This nakshatra governs your deeper personality traits and karmic patterns.\n\n"
+    parts.append(f"MOON'S NAKSHATRA: {moon_nakshatra['name']} (Lord: {moon_nakshatra['lord']}) - Pada {moon_nakshatra['pada']}\n")
+    parts.append(f"This nakshatra governs your deeper personality traits and karmic patterns.\n\n")
     
-    report += f"""===============================================================================
+    parts.append(f"""===============================================================================
 WESTERN (TROPICAL) ASTROLOGY ANALYSIS
 ===============================================================================
 
-"""
+""")
     
     if include_houses:
-        western_asc_sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                           "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(houses['1'] // 30)]
-        report += f"ASCENDANT: {western_asc_sign} at {houses['1']:.2f}°\n"
-        report += f"WESTERN INTERPRETATION: Your mask to the world and life approach.\n"
-        report += f"Traits: {vedic_sign_meanings[western_asc_sign]}\n\n"
+        western_asc_sign = sign_of(houses[0])
+        parts.append(f"ASCENDANT: {western_asc_sign} at {houses[0]:.2f}°\n")
+        parts.append(f"WESTERN INTERPRETATION: Your mask to the world and life approach.\n")
+        parts.append(f"Traits: {_VEDIC_SIGN_MEANINGS[western_asc_sign]}\n\n")
     
-    report += "WESTERN PLANETARY POSITIONS:\n\n"
+    parts.append("WESTERN PLANETARY POSITIONS:\n\n")
     
     # Focus on the "Big 3" for Western interpretation
-    sun_sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(tropical_positions['Sun'] // 30)]
-    moon_sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                 "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(tropical_positions['Moon'] // 30)]
+    sun_sign = tropical_signs[0]
+    moon_sign = tropical_signs[MOON]
     
-    report += f"SUN SIGN: {sun_sign}\n"
-    report += f"Your core identity: {vedic_sign_meanings[sun_sign]}\n\n"
+    parts.append(f"SUN SIGN: {sun_sign}\n")
+    parts.append(f"Your core identity: {_VEDIC_SIGN_MEANINGS[sun_sign]}\n\n")
     
-    report += f"MOON SIGN: {moon_sign}\n"
-    report += f"Your emotional nature: {vedic_sign_meanings[moon_sign]}\n\n"
+    parts.append(f"MOON SIGN: {moon_sign}\n")
+    parts.append(f"Your emotional nature: {_VEDIC_SIGN_MEANINGS[moon_sign]}\n\n")
     
-    report += f"""===============================================================================
+    parts.append(f"""===============================================================================
 CHINESE FOUR PILLARS (BAZI) ANALYSIS
 ===============================================================================
 
@@ -736,7 +423,7 @@ SYNTHESIS & LIFE PATH SUMMARY
 KEY INSIGHTS FROM YOUR MULTI-SYSTEM ANALYSIS:
 
 1. PRIMARY ESSENCE (What Defines You):
-   - Vedic Moon Nakshatra: {nakshatra_info[0]} - Your soul's deeper nature
+   - Vedic Moon Nakshatra: {moon_nakshatra['name']} - Your soul's deeper nature
    - Western Sun Sign: {sun_sign} - Your conscious identity
    - Chinese Day Master: {four_pillars['day'][0][1]} - Your core energy type
    - Mayan Day Sign: {tzolkin['day_sign']} - Your spiritual frequency
@@ -780,9 +467,20 @@ and growth, not as limitations.
 
 Generated by Professional Multi-System Astrological Calculator
 For personal insight and spiritual growth only
-"""
+""")
     
-    return report
+    return "".join(parts)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _make_base_map(lat_round, lon_round):
+    """Tiles and LatLngPopup centred on rounded coordinates; each caller gets its own copy"""
+    m = folium.Map(location=[lat_round, lon_round], zoom_start=8)
+    m.add_child(folium.LatLngPopup())
+    return m
+
+# st.fragment reruns only the decorated block on its own widget events; on
+# Streamlit versions without it the block simply runs inline with the script
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
 
 def create_clickable_map(lat=27.7172, lon=85.3240):
     """Create an interactive map where users can click to select coordinates"""
@@ -790,8 +488,8 @@ def create_clickable_map(lat=27.7172, lon=85.3240):
         st.error("Please install folium and streamlit-folium for interactive map")
         return None, None
     
-    # Create the map
-    m = folium.Map(location=[lat, lon], zoom_start=8)
+    # Base map is cached per ~1 km cell so nearby selections reuse it
+    m = _make_base_map(round(lat, 2), round(lon, 2))
     
     # Add a marker for current location
     folium.Marker(
@@ -801,9 +499,6 @@ def create_clickable_map(lat=27.7172, lon=85.3240):
         icon=folium.Icon(color="red", icon="star")
     ).add_to(m)
     
-    # Add LatLngPopup to show coordinates when clicking
-    m.add_child(folium.LatLngPopup())
-    
     # Display the map and capture click events
     map_data = st_folium(m, width=700, height=400, key="location_map")
     
@@ -816,11 +511,197 @@ def create_clickable_map(lat=27.7172, lon=85.3240):
     
     return clicked_lat, clicked_lon
 
+@st.cache_resource(max_entries=64)
+def _loc_df(lat, lon):
+    """One-point frame for st.map, shared across reruns (st.map only reads it)"""
+    return pd.DataFrame({'lat': [lat], 'lon': [lon]})
+
+@_fragment
+def _map_fragment():
+    """Location picker map. Clicks rerun only this fragment; a full rerun is
+    requested only when the selected coordinates actually change"""
+    st.info("Click on the map to select your birth location")
+    clicked_lat, clicked_lon = create_clickable_map(
+        st.session_state.lat_value, 
+        st.session_state.lon_value
+    )
+    if clicked_lat and clicked_lon and \
+            (clicked_lat, clicked_lon) != (st.session_state.lat_value, st.session_state.lon_value):
+        st.session_state.lat_value = clicked_lat
+        st.session_state.lon_value = clicked_lon
+        st.rerun()
+
+_UTC = pytz.UTC
+
+def _birth_utc(date_iso, time_iso, tz_name):
+    """UTC datetime of a local birth date and time in the named timezone"""
+    local = datetime.fromisoformat(f"{date_iso}T{time_iso}")
+    return pytz.timezone(tz_name).localize(local).astimezone(_UTC)
+
+def _render_vedic(results, use_high_precision):
+    """Vedic tab: ascendant, sidereal positions and the Moon's nakshatra"""
+    st.subheader("Vedic (Sidereal) Astrology")
+    
+    if results['vedic_ascendant'] is not None:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Ascendant (Lagna)", results['vedic_asc_sign'], _FMT_DEG(results['vedic_ascendant']))
+        with col2:
+            st.metric("Ayanamsa (Lahiri)", _FMT_DEG(results['ayanamsa']))
+        with col3:
+            if use_high_precision:
+                st.metric("Precision", "VSOP87", "High")
+    
+    # Planetary positions
+    st.write("**Planetary Positions (Sidereal):**")
+    st.dataframe(results['vedic_table'], hide_index=True)
+    
+    # Nakshatra analysis
+    moon_nakshatra = _get_calc().get_nakshatra_details(float(results['vedic_positions'][MOON]))
+    st.write("**Moon's Nakshatra:**")
+    st.dataframe(pd.DataFrame([{
+        "Nakshatra": moon_nakshatra['name'],
+        "Lord": moon_nakshatra['lord'],
+        "Pada": str(moon_nakshatra['pada'])
+    }]), hide_index=True)
+    
+    st.info(f"**Meaning:** {moon_nakshatra['meaning']}")
+
+def _render_western(results, use_high_precision):
+    """Western tab: ascendant and tropical positions"""
+    st.subheader("Western (Tropical) Astrology")
+    
+    if results['ascendant'] is not None:
+        st.metric("Ascendant", results['western_asc_sign'], _FMT_DEG(results['ascendant']))
+    
+    # Planetary positions
+    st.write("**Planetary Positions (Tropical):**")
+    st.dataframe(results['tropical_table'], hide_index=True)
+
+def _render_chinese(results, use_high_precision):
+    """Chinese tab: the Four Pillars and the Day Master"""
+    st.subheader("Chinese Four Pillars (Bazi)")
+    
+    # Display Four Pillars
+    st.write("**The Four Pillars of Destiny:**")
+    pillars_data = [
+        (pillar_name.title(), f"{stem[0]} ({stem[1]})", f"{branch[0]} ({branch[1]})")
+        for pillar_name, (stem, branch) in results['four_pillars'].items()
+    ]
+    
+    st.dataframe(pd.DataFrame.from_records(pillars_data, columns=_PILLAR_COLS), hide_index=True)
+    
+    # Day Master (most important)
+    day_master = results['four_pillars']['day'][0]
+    st.success(f"**Day Master:** {day_master[0]} ({day_master[1]}) - Your core essence")
+
+def _render_mayan(results, use_high_precision):
+    """Mayan tab: Tzolkin day sign, tone and kin"""
+    st.subheader("Mayan Tzolkin Calendar")
+    tzolkin = results['tzolkin']
+    
+    st.dataframe(pd.DataFrame([{
+        "Day Sign": tzolkin['day_sign'],
+        "Galactic Tone": str(tzolkin['galactic_tone']),
+        "Kin Number": str(tzolkin['kin'])
+    }]), hide_index=True)
+    
+    st.write(f"**Glyph:** {tzolkin['glyph']}")
+    st.info(f"**Meaning:** {tzolkin['meaning']}")
+
+def _render_comparative(results, use_high_precision):
+    """Comparative tab: primary sign per system"""
+    st.subheader("Cross-System Analysis")
+    four_pillars = results['four_pillars']
+    
+    comparison_data = {
+        "System": ["Vedic", "Western", "Chinese", "Mayan"],
+        "Primary Sign": [
+            results['vedic_asc_sign'] or "Calculate houses to see",
+            results['western_asc_sign'] or "Calculate houses to see",
+            f"{four_pillars['day'][0][1]} ({four_pillars['day'][1][1]})",
+            results['tzolkin']['day_sign']
+        ],
+        "Calculation Base": [
+            "Sidereal Zodiac",
+            "Tropical Zodiac", 
+            "Four Pillars/Bazi",
+            "Tzolkin Calendar"
+        ],
+        "Key Focus": [
+            "Karma & Dharma",
+            "Psychological Traits",
+            "Life Balance & Timing",
+            "Cosmic Consciousness"
+        ]
+    }
+    
+    st.dataframe(pd.DataFrame(comparison_data), hide_index=True)
+    
+    # Precision information
+    if use_high_precision:
+        st.success("High-precision calculations using VSOP87 algorithms")
+
+# Result views in display order. Only the selected one is rendered per run
+_RESULT_VIEWS = {
+    "🕉 Vedic": _render_vedic,
+    "♋ Western": _render_western,
+    "☯ Chinese": _render_chinese,
+    "🌞 Mayan": _render_mayan,
+    "✦ Comparative": _render_comparative,
+}
+
+@_fragment
+def _results_view(results, use_high_precision):
+    """Tab-style selector for the different systems; unlike st.tabs, only
+    the chosen view is built. As a fragment, switching views reruns just
+    this selector and its view, not the whole script"""
+    view = st.radio("View", tuple(_RESULT_VIEWS), horizontal=True,
+                    label_visibility="collapsed", key="result_view")
+    _RESULT_VIEWS[view](results, use_high_precision)
+
+@_fragment
+def _report_section(results):
+    """Report buttons and viewer. As a fragment, their clicks rerun only this
+    section instead of the whole chart page"""
+    st.header("Professional Report")
+    
+    # One report serves both the Generate and Download buttons
+    report_text = generate_report_text(**{key: results[key] for key in _REPORT_ARGS})
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Generate Report Button
+        if st.button("Generate Complete Report", type="primary"):
+            # Store in session state to display
+            st.session_state['generated_report'] = report_text
+            st.success("Professional astrological report generated!")
+            st.balloons()
+    
+    with col2:
+        # Create download button
+        st.download_button(
+            label="Download Report (TXT)",
+            data=report_text,
+            file_name=f"astrological_report_{results['birth_data']['date'].replace('-', '')}.txt",
+            mime="text/plain",
+            help="Download your complete astrological analysis as a text file"
+        )
+    
+    # DISPLAY THE GENERATED REPORT
+    if 'generated_report' in st.session_state:
+        st.header("Your Complete Astrological Report")
+        
+        # Display report in an expandable, read-only code block
+        with st.expander("View Full Report", expanded=True):
+            st.code(st.session_state['generated_report'], language=None)
+
 def main():
     inject_css()
     cosmic_hero()
 
-    calc = ProfessionalAstrologicalCalculator()
+    calc = _get_calc()
     
     # Initialize session state for coordinates
     if 'lat_value' not in st.session_state:
@@ -894,51 +775,47 @@ def main():
         
         calculate_button = st.button("Calculate Complete Chart", type="primary")
 
+    # One ISO form of the birth date and time for display, keys and storage
+    date_iso = birth_date.isoformat()
+    time_iso = birth_time.isoformat()
+
     # Main content area
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.subheader("Birth Location")
         
-        if location_method == "Interactive Map":
-            if FOLIUM_AVAILABLE:
-                st.info("Click on the map to select your birth location")
-                clicked_lat, clicked_lon = create_clickable_map(
-                    st.session_state.lat_value, 
-                    st.session_state.lon_value
-                )
-                if clicked_lat and clicked_lon:
-                    st.session_state.lat_value = clicked_lat
-                    st.session_state.lon_value = clicked_lon
-            else:
-                st.error("Interactive map requires: pip install streamlit-folium")
-                st.info("Please use Manual Coordinates or Major Cities instead")
+        if location_method == "Interactive Map" and FOLIUM_AVAILABLE:
+            _map_fragment()
         else:
+            if location_method == "Interactive Map" and not st.session_state.get('folium_warned'):
+                st.toast("Interactive map requires: pip install streamlit-folium. "
+                         "Use Manual Coordinates or Major Cities instead.")
+                st.session_state.folium_warned = True
             # Show regular map for other methods
             if st.session_state.lat_value and st.session_state.lon_value:
-                location_df = pd.DataFrame({
-                    'lat': [st.session_state.lat_value],
-                    'lon': [st.session_state.lon_value],
-                    'info': ['Birth Location']
-                })
-                st.map(location_df, zoom=8)
+                st.map(_loc_df(round(st.session_state.lat_value, 4),
+                               round(st.session_state.lon_value, 4)), zoom=8)
     
     with col2:
         if st.session_state.lat_value and st.session_state.lon_value:
             st.subheader("Summary")
             st.metric("Latitude", f"{st.session_state.lat_value:.4f}°")
             st.metric("Longitude", f"{st.session_state.lon_value:.4f}°")
-            st.metric("Date", str(birth_date))
-            st.metric("Time", str(birth_time))
-
-    # Calculations
-    if calculate_button and st.session_state.lat_value and st.session_state.lon_value:
+            st.metric("Date", date_iso)
+            st.metric("Time", time_iso)
+
+    # Calculations - only when the birth details differ from the stored chart,
+    # so reruns from other buttons go straight to rendering
+    inputs_key = (date_iso, time_iso,
+                  st.session_state.lat_value, st.session_state.lon_value,
+                  timezone, house_system, include_houses)
+    if (calculate_button and st.session_state.lat_value and st.session_state.lon_value
+            and inputs_key != st.session_state.get('last_inputs_key')):
         with st.spinner("Performing calculations..."):
             try:
                 birth_datetime = datetime.combine(birth_date, birth_time)
-                tz = pytz.timezone(timezone)
-                birth_datetime = tz.localize(birth_datetime)
-                birth_datetime_utc = birth_datetime.astimezone(pytz.UTC)
+                birth_datetime_utc = _birth_utc(date_iso, time_iso, timezone)
                 
                 # Calculate Julian Day
                 jd = calc.calculate_julian_day(
@@ -954,262 +831,77 @@ def main():
                 vedic_positions, ayanamsa = calc.calculate_vedic_positions(tropical_positions, jd)
                 
                 # Calculate houses if requested
+                houses = ascendant = vedic_ascendant = None
+                vedic_asc_sign = western_asc_sign = None
                 if include_houses:
                     houses, ascendant = calc.calculate_houses(jd, st.session_state.lat_value, st.session_state.lon_value, house_system)
                     vedic_ascendant = (ascendant - ayanamsa) % 360
+                    vedic_asc_sign = sign_of(vedic_ascendant)
+                    western_asc_sign = sign_of(ascendant)
                 
                 # Calculate Chinese and Mayan systems
                 four_pillars = calc.calculate_four_pillars(birth_datetime)
-                tzolkin = calc.calculate_mayan_tzolkin(birth_datetime)
+                tzolkin = calc.calculate_mayan_tzolkin(calc.calculate_julian_day(
+                    birth_date.year, birth_date.month, birth_date.day,
+                    birth_time.hour, birth_time.minute
+                ))
                 
                 # Store results in session state for report generation
                 st.session_state['calculation_results'] = {
                     'birth_data': {
-                        'date': str(birth_date),
-                        'time': str(birth_time),
+                        'date': date_iso,
+                        'time': time_iso,
                         'lat': st.session_state.lat_value,
                         'lon': st.session_state.lon_value,
                         'timezone': timezone
                     },
                     'tropical_positions': tropical_positions,
                     'vedic_positions': vedic_positions,
+                    'tropical_table': _positions_frame(tropical_positions),
+                    'vedic_table': _positions_frame(vedic_positions),
                     'ayanamsa': ayanamsa,
-                    'houses': houses if include_houses else None,
+                    'houses': houses,
+                    'ascendant': ascendant,
+                    'vedic_ascendant': vedic_ascendant,
+                    'vedic_asc_sign': vedic_asc_sign,
+                    'western_asc_sign': western_asc_sign,
                     'four_pillars': four_pillars,
                     'tzolkin': tzolkin,
                     'jd': jd,
                     'include_houses': include_houses,
                     'house_system': house_system
                 }
+                st.session_state['last_inputs_key'] = inputs_key
+                # A new chart makes any previously generated report stale
+                st.session_state.pop('generated_report', None)
                 
-                # Results display
-                st.header("✦ Complete Astrological Analysis")
-                
-                # Create tabs for different systems
-                tabs = st.tabs([
-                    "🕉 Vedic",
-                    "♋ Western",
-                    "☯ Chinese",
-                    "🌞 Mayan",
-                    "✦ Comparative"
-                ])
-                
-                with tabs[0]:  # Vedic
-                    st.subheader("Vedic (Sidereal) Astrology")
-                    
-                    if include_houses:
-                        vedic_asc_sign = calc.zodiac_signs[int(vedic_ascendant // 30)]
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Ascendant (Lagna)", vedic_asc_sign, f"{vedic_ascendant:.2f}°")
-                        with col2:
-                            st.metric("Ayanamsa (Lahiri)", f"{ayanamsa:.2f}°")
-                        with col3:
-                            if use_high_precision:
-                                st.metric("Precision", "VSOP87", "High")
-                    
-                    # Planetary positions
-                    st.write("**Planetary Positions (Sidereal):**")
-                    planet_data = []
-                    for planet, position in vedic_positions.items():
-                        sign = calc.zodiac_signs[int(position // 30)]
-                        degree_in_sign = position % 30
-                        planet_data.append({
-                            "Planet": planet,
-                            "Sign": sign,
-                            "Longitude": f"{position:.2f}°",
-                            "Degree in Sign": f"{degree_in_sign:.2f}°"
-                        })
-                    
-                    st.dataframe(pd.DataFrame(planet_data), hide_index=True)
-                    
-                    # Nakshatra analysis
-                    moon_nakshatra = calc.get_nakshatra_details(vedic_positions['Moon'])
-                    st.write("**Moon's Nakshatra:**")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Nakshatra", moon_nakshatra['name'])
-                    with col2:
-                        st.metric("Lord", moon_nakshatra['lord'])
-                    with col3:
-                        st.metric("Pada", str(moon_nakshatra['pada']))
-                    
-                    st.info(f"**Meaning:** {moon_nakshatra['meaning']}")
-                
-                with tabs[1]:  # Western
-                    st.subheader("Western (Tropical) Astrology")
-                    
-                    if include_houses:
-                        western_asc_sign = calc.zodiac_signs[int(ascendant // 30)]
-                        st.metric("Ascendant", western_asc_sign, f"{ascendant:.2f}°")
-                    
-                    # Planetary positions
-                    st.write("**Planetary Positions (Tropical):**")
-                    western_data = []
-                    for planet, position in tropical_positions.items():
-                        sign = calc.zodiac_signs[int(position // 30)]
-                        degree_in_sign = position % 30
-                        western_data.append({
-                            "Planet": planet,
-                            "Sign": sign,
-                            "Longitude": f"{position:.2f}°",
-                            "Degree in Sign": f"{degree_in_sign:.2f}°"
-                        })
-                    
-                    st.dataframe(pd.DataFrame(western_data), hide_index=True)
-                
-                with tabs[2]:  # Chinese
-                    st.subheader("Chinese Four Pillars (Bazi)")
-                    
-                    # Display Four Pillars
-                    st.write("**The Four Pillars of Destiny:**")
-                    pillars_data = []
-                    for pillar_name, (stem, branch) in four_pillars.items():
-                        pillars_data.append({
-                            "Pillar": pillar_name.title(),
-                            "Heavenly Stem": f"{stem[0]} ({stem[1]})",
-                            "Earthly Branch": f"{branch[0]} ({branch[1]})"
-                        })
-                    
-                    st.dataframe(pd.DataFrame(pillars_data), hide_index=True)
-                    
-                    # Day Master (most important)
-                    day_master = four_pillars['day'][0]
-                    st.success(f"**Day Master:** {day_master[0]} ({day_master[1]}) - Your core essence")
-                
-                with tabs[3]:  # Mayan
-                    st.subheader("Mayan Tzolkin Calendar")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Day Sign", tzolkin['day_sign'])
-                    with col2:
-                        st.metric("Galactic Tone", str(tzolkin['galactic_tone']))
-                    with col3:
-                        st.metric("Kin Number", str(tzolkin['kin']))
-                    
-                    st.write(f"**Glyph:** {tzolkin['glyph']}")
-                    st.info(f"**Meaning:** {tzolkin['meaning']}")
-                
-                with tabs[4]:  # Comparative
-                    st.subheader("Cross-System Analysis")
-                    
-                    comparison_data = {
-                        "System": ["Vedic", "Western", "Chinese", "Mayan"],
-                        "Primary Sign": [
-                            vedic_asc_sign if include_houses else "Calculate houses to see",
-                            western_asc_sign if include_houses else "Calculate houses to see",
-                            f"{four_pillars['day'][0][1]} ({four_pillars['day'][1][1]})",
-                            tzolkin['day_sign']
-                        ],
-                        "Calculation Base": [
-                            "Sidereal Zodiac",
-                            "Tropical Zodiac", 
-                            "Four Pillars/Bazi",
-                            "Tzolkin Calendar"
-                        ],
-                        "Key Focus": [
-                            "Karma & Dharma",
-                            "Psychological Traits",
-                            "Life Balance & Timing",
-                            "Cosmic Consciousness"
-                        ]
-                    }
-                    
-                    st.dataframe(pd.DataFrame(comparison_data), hide_index=True)
-                    
-                    # Precision information
-                    if use_high_precision:
-                        st.success("High-precision calculations using VSOP87 algorithms")
-                    
-                # Summary section
-                st.header("Calculation Summary")
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Julian Day", f"{jd:.2f}")
-                with col2:
-                    st.metric("Ayanamsa", f"{ayanamsa:.4f}°")
-                with col3:
-                    st.metric("House System", house_system)
-                with col4:
-                    st.metric("Systems Calculated", "4")
-                
-                # REPORT GENERATION SECTION
-                st.header("Professional Report")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Generate Report Button
-                    if st.button("Generate Complete Report", type="primary"):
-                        if 'calculation_results' in st.session_state:
-                            results = st.session_state['calculation_results']
-                            
-                            # Generate the actual report
-                            report_text = generate_report_text(
-                                results['birth_data'],
-                                results['vedic_positions'],
-                                results['tropical_positions'],
-                                results['four_pillars'],
-                                results['tzolkin'],
-                                results['houses'],
-                                results['ayanamsa'],
-                                results['include_houses'],
-                                results['house_system']
-                            )
-                            
-                            # Store in session state to display
-                            st.session_state['generated_report'] = report_text
-                            st.success("Professional astrological report generated!")
-                            st.balloons()
-                        else:
-                            st.error("Please calculate the chart first!")
-                
-                with col2:
-                    # Download button
-                    if 'calculation_results' in st.session_state:
-                        results = st.session_state['calculation_results']
-                        
-                        # Generate report text for download
-                        report_text = generate_report_text(
-                            results['birth_data'],
-                            results['vedic_positions'],
-                            results['tropical_positions'],
-                            results['four_pillars'],
-                            results['tzolkin'],
-                            results['houses'],
-                            results['ayanamsa'],
-                            results['include_houses'],
-                            results['house_system']
-                        )
-                        
-                        # Create download button
-                        st.download_button(
-                            label="Download Report (TXT)",
-                            data=report_text,
-                            file_name=f"astrological_report_{birth_date.strftime('%Y%m%d')}.txt",
-                            mime="text/plain",
-                            help="Download your complete astrological analysis as a text file"
-                        )
-                
-                # DISPLAY THE GENERATED REPORT
-                if 'generated_report' in st.session_state:
-                    st.header("Your Complete Astrological Report")
-                    
-                    # Display report in expandable text area
-                    with st.expander("View Full Report", expanded=True):
-                        st.text_area(
-                            "Complete Astrological Analysis",
-                            value=st.session_state['generated_report'],
-                            height=600,
-                            label_visibility="collapsed",
-                            key="report_display"
-                        )
-                    
             except Exception as e:
                 st.error(f"Calculation error: {str(e)}")
                 st.info("Please check your birth details and try again")
 
+    # Results display - rendered from the stored chart on every rerun
+    if 'calculation_results' in st.session_state:
+        results = st.session_state['calculation_results']
+        ayanamsa = results['ayanamsa']
+        jd = results['jd']
+        house_system = results['house_system']
+        
+        st.header("✦ Complete Astrological Analysis")
+        
+        _results_view(results, use_high_precision)
+        
+        # Summary section
+        st.header("Calculation Summary")
+        st.dataframe(pd.DataFrame([{
+            "Julian Day": f"{jd:.2f}",
+            "Ayanamsa": f"{ayanamsa:.4f}°",
+            "House System": house_system,
+            "Systems Calculated": "4"
+        }]), hide_index=True)
+        
+        # REPORT GENERATION SECTION
+        _report_section(results)
+
     # ================================================================
     # AI READING + FEEDBACK
     # Placed at the end of main() and gated on a calculated chart, so
@@ -1218,14 +910,15 @@ def main():
     # ================================================================
     if 'calculation_results' in st.session_state:
         results = st.session_state['calculation_results']
-        nak = calc.get_nakshatra_details(results['vedic_positions']['Moon'])
+        vedic_by_planet = planet_dict(results['vedic_positions'])
+        nak = calc.get_nakshatra_details(float(results['vedic_positions'][MOON]))
         _asc = None
-        if results.get('include_houses') and results.get('houses'):
-            _asc = results['houses'].get('1')
+        if results['houses'] is not None:
+            _asc = float(results['houses'][0])
         chart = build_chart_summary(
             results['birth_data'],
-            results['vedic_positions'],
-            results['tropical_positions'],
+            vedic_by_planet,
+            planet_dict(results['tropical_positions']),
             results['four_pillars'],
             results['tzolkin'],
             nak,